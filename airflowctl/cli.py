@@ -1,26 +1,28 @@
 from __future__ import annotations
 
+import importlib
 import os
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
 import yaml
 from rich import print
-from rich.console import Console
-from rich.table import Table
 
-from airflowctl.modes.uv import UvMode
-from airflowctl.modes.virtualenv import VirtualenvMode
 from airflowctl.utils.install_airflow import get_latest_airflow_version
 from airflowctl.utils.project import (
     GLOBAL_TRACKING_FILE,
     INSTALLED_PYTHON_VERSION,
     airflowctl_project_check,
     create_project,
-    get_conf_or_raise,
     get_settings_file_path_or_raise,
+    load_settings,
 )
 
+if TYPE_CHECKING:
+    from airflowctl.modes.uv import UvMode
+    from airflowctl.modes.virtualenv import VirtualenvMode
+
 app = typer.Typer()
 
 # TODO: Add a --verbose flag to all commands
@@ -34,9 +36,11 @@ project_path_argument = typer.Argument(
     resolve_path=True,
 )
 
+# Modes are imported only when a command needs one, so that commands like `init`, `list` and `--help`
+# don't pay for importing them
 mode_mappings = {
-    "uv": UvMode,
-    "virtualenv": VirtualenvMode,
+    "uv": "airflowctl.modes.uv.UvMode",
+    "virtualenv": "airflowctl.modes.virtualenv.VirtualenvMode",
 }
 
 
@@ -51,8 +55,9 @@ def init(
         help="Name of the Airflow project to be initialized.",
     ),
     airflow_version: str = typer.Option(
-        default=get_latest_airflow_version(),
+        default=None,
         help="Version of Apache Airflow to be used in the project. Defaults to latest.",
+        show_default=False,
     ),
     python_version: str = typer.Option(
         default=INSTALLED_PYTHON_VERSION,
@@ -74,6 +79,10 @@ def init(
     """
     Initialize a new Airflow project.
     """
+    # Only query PyPI when needed, so that other commands (and --help) don't pay for the HTTP call
+    if not airflow_version:
+        airflow_version = get_latest_airflow_version(verbose=True)
+
     project_dir, settings_file = create_project(
         project_name, project_path, airflow_version, python_version, venv_path
     )
@@ -103,11 +112,13 @@ def build(
 
     settings_file = get_settings_file_path_or_raise(project_path, settings_file)
 
-    with open(settings_file) as f:
-        config = yaml.safe_load(f)
+    config = load_settings(settings_file)
 
-    airflow_version = get_conf_or_raise("airflow_version", config)
-    python_version = get_conf_or_raise("python_version", config)
+    try:
+        airflow_version, python_version = config["airflow_version"], config["python_version"]
+    except KeyError as e:
+        typer.echo(f"Key {e} not found in settings file.")
+        raise typer.Exit(1)
     mode_config = config.get("mode", {}).get("config", {})
 
     mode_cls = _get_mode(config)
@@ -132,7 +143,11 @@ def _get_mode(config: None | dict = None) -> type[VirtualenvMode] | type[UvMode]
         mode_conf = "uv"
 
     # Return the appropriate mode class from the mapping
-    return mode_mappings.get(mode_conf)
+    mode_cls_path = mode_mappings.get(mode_conf)
+    if not mode_cls_path:
+        return None
+    module_name, _, cls_name = mode_cls_path.rpartition(".")
+    return getattr(importlib.import_module(module_name), cls_name)
 
 
 @app.command()
@@ -185,6 +200,8 @@ def logs(
 @app.command("list")
 def list_cmd():
     """List all Airflow projects created using this CLI."""
+    from rich.console import Console
+    from rich.table import Table
 
     tracking_file = GLOBAL_TRACKING_FILE
 
@@ -213,8 +230,7 @@ def list_cmd():
         if not settings_file.exists():
             continue
 
-        with open(settings_file) as sf:
-            settings = yaml.safe_load(sf)
+        settings = load_settings(settings_file)
 
         config_file = Path(project_dir) / ".airflowctl" / "config.yaml"
         if not config_file.exists():
@@ -241,6 +257,7 @@ def list_cmd():
 @app.command()
 def info(project_path: Path = project_path_argument):
     """Display information about the current Airflow project."""
+    from rich.console import Console
 
     airflowctl_project_check(project_path)
 
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import os
 import shutil
 import subprocess
 from pathlib import Path
@@ -11,7 +10,7 @@ from rich import print
 
 from airflowctl.modes.virtualenv import VirtualenvMode
 from airflowctl.utils.install_airflow import install_airflow
-from airflowctl.utils.project import INSTALLED_PYTHON_VERSION, get_settings_file_path_or_raise
+from airflowctl.utils.project import INSTALLED_PYTHON_VERSION, get_settings_file_path_or_raise, load_settings
 
 
 class UvMode(VirtualenvMode):
@@ -20,21 +19,18 @@ class UvMode(VirtualenvMode):
 
         if not self.airflow_version:
             settings_file = get_settings_file_path_or_raise(self.project_path)
-            with settings_file.open() as f:
-                settings = yaml.safe_load(f)
+            settings = load_settings(settings_file)
             self.airflow_version = settings.get("airflow_version")
 
         if not self.python_version:
             settings_file = get_settings_file_path_or_raise(self.project_path)
-            with settings_file.open() as f:
-                settings = yaml.safe_load(f)
+            settings = load_settings(settings_file)
             self.python_version = settings.get("python_version", INSTALLED_PYTHON_VERSION)
 
-        # Create virtual environment
-        venv_path = self.verify_or_create_venv(
+        # Create virtual environment and download the constraints file at the same time
+        venv_path, constraints_file = self._create_venv_and_download_constraints(
             venv_path=venv_path,
-            recreate=recreate_venv,
-            python_version=self.python_version,
+            recreate_venv=recreate_venv,
         )
 
         # Install Airflow and dependencies
@@ -44,6 +40,7 @@ class UvMode(VirtualenvMode):
             python_version=self.python_version,
             project_path=self.project_path,
             pip_provider="uv pip",
+            constraints_file=constraints_file,
         )
 
         # add venv_path to config.yaml
@@ -61,12 +58,12 @@ class UvMode(VirtualenvMode):
         if isinstance(venv_path, str):
             venv_path = Path(venv_path).absolute()
 
-        if recreate and os.path.exists(venv_path):
+        if recreate and venv_path.exists():
             print(f"Recreating virtual environment at [bold blue]{venv_path}[/bold blue]")
             shutil.rmtree(venv_path)
 
-        venv_bin_python = os.path.join(venv_path, "bin", "python")
-        if os.path.exists(venv_path) and not os.path.exists(venv_bin_python):
+        venv_bin_python = venv_path / "bin" / "python"
+        if venv_path.exists() and not venv_bin_python.exists():
             print(f"[bold red]Virtual environment at {venv_path} does not exist or is not valid.[/bold red]")
             raise SystemExit()
 
@@ -87,19 +84,15 @@ class UvMode(VirtualenvMode):
             print("Install uv to use a specific Python version.")
             raise typer.Exit(code=1)
 
-        # Create the virtual environment
+        # Create the virtual environment. `--seed` installs pip with uv, which is much faster than
+        # running ensurepip. Packages are installed with the uv binary, so there is no need to
+        # upgrade pip or install uv inside the venv.
         subprocess.run(
-            ["uv", "venv", venv_path, "--python", python_version],
+            ["uv", "venv", venv_path, "--python", python_version, "--seed"],
             stdout=subprocess.PIPE,
             text=True,
             check=True,
         )
-
-        venv_bin_python = os.path.join(venv_path, "bin", "python")
-
-        # Continue with using the virtual environment
-        subprocess.run([venv_bin_python, "-m", "ensurepip"], check=True)
-        subprocess.run([venv_bin_python, "-m", "pip", "install", "--upgrade", "pip", "uv"], check=True)
         print(
             f"Virtual environment created at [bold blue]{venv_path}[/bold blue] with Python version {python_version}"
         )
@@ -6,23 +6,90 @@ import shutil
 import subprocess
 import sys
 import tempfile
-import time
 import venv
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
 import yaml
-from dotenv import load_dotenv
 from packaging import version
 from rich import print
-from rich.console import Console
 
 from airflowctl.utils.connections import add_connections
-from airflowctl.utils.install_airflow import install_airflow
-from airflowctl.utils.paths import convert_str_or_path_to_absolute_path
-from airflowctl.utils.project import INSTALLED_PYTHON_VERSION, get_settings_file_path_or_raise
+from airflowctl.utils.install_airflow import (
+    atomic_write_bytes,
+    download_constraints,
+    get_http_client,
+    install_airflow,
+)
+from airflowctl.utils.paths import GLOBAL_CONFIG_DIR, convert_str_or_path_to_absolute_path
+from airflowctl.utils.project import INSTALLED_PYTHON_VERSION, get_settings_file_path_or_raise, load_settings
 from airflowctl.utils.variables import add_variables
 
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+PIP_ZIPAPP_URL = "https://bootstrap.pypa.io/pip/pip.pyz"
+# The latest pip zipapp drops old Python versions, which get the last pip release supporting them instead
+PIP_ZIPAPP_MIN_PYTHON_VERSION = (3, 9)
+
+
+class FastEnvBuilder(venv.EnvBuilder):
+    """
+    Virtual environment builder that skips the slow ``ensurepip`` step. pip (and setuptools) are
+    installed and upgraded in one go from the pip zipapp instead.
+    """
+
+    def __init__(self):
+        super().__init__(symlinks=os.name != "nt", with_pip=False, system_site_packages=False)
+
+    def post_setup(self, context):
+        # The virtual environment uses the same Python as the one running airflowctl
+        bootstrap_pip(context.env_exe, sys.version_info[:2])
+
+
+def get_pip_zipapp(python_version: tuple[int, int]) -> tuple[str, Path]:
+    """Return the URL of the pip zipapp supporting ``python_version`` and where it is cached."""
+    if python_version >= PIP_ZIPAPP_MIN_PYTHON_VERSION:
+        return PIP_ZIPAPP_URL, GLOBAL_CONFIG_DIR / "pip.pyz"
+
+    major_minor = ".".join(str(v) for v in python_version)
+    return (
+        f"https://bootstrap.pypa.io/pip/{major_minor}/pip.pyz",
+        GLOBAL_CONFIG_DIR / f"pip-{major_minor}.pyz",
+    )
+
+
+def bootstrap_pip(venv_bin_python: str | Path, python_version: tuple[int, int]):
+    """Install the latest pip in the virtual environment using the (cached) pip zipapp."""
+    venv_bin_python = str(venv_bin_python)
+    pip_zipapp_url, pip_zipapp_file = get_pip_zipapp(python_version)
+    try:
+        if not pip_zipapp_file.exists():
+            _download_pip_zipapp(pip_zipapp_url, pip_zipapp_file)
+
+        subprocess.run(
+            [venv_bin_python, str(pip_zipapp_file), "install", "--upgrade", "pip", "setuptools"],
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        # Offline or the zipapp does not support this Python version
+        subprocess.run([venv_bin_python, "-m", "ensurepip", "--upgrade"], check=True)
+
+
+def _download_pip_zipapp(url: str, path: Path):
+    # httpx is only needed when the zipapp is not cached yet
+    import httpx
+
+    try:
+        response = get_http_client().get(url)
+        response.raise_for_status()
+    except httpx.HTTPError as e:
+        raise OSError(f"Could not download {url}: {e}") from e
+    atomic_write_bytes(path, response.content)
+
 
 class VirtualenvMode:
     def __init__(
@@ -40,8 +107,7 @@ class VirtualenvMode:
         if not venv_path:
             settings_file = get_settings_file_path_or_raise(self.project_path, raise_if_not_found=False)
             if settings_file.exists():
-                with settings_file.open() as f:
-                    settings = yaml.safe_load(f)
+                settings = load_settings(settings_file)
                 venv_path = settings.get("mode", {}).get("config", {}).get("venv_path")
 
         self.venv_path: Path = convert_str_or_path_to_absolute_path(venv_path) or self.project_path / ".venv"
@@ -55,21 +121,18 @@ class VirtualenvMode:
 
         if not self.airflow_version:
             settings_file = get_settings_file_path_or_raise(self.project_path)
-            with settings_file.open() as f:
-                settings = yaml.safe_load(f)
+            settings = load_settings(settings_file)
             self.airflow_version = settings.get("airflow_version")
 
         if not self.python_version:
             settings_file = get_settings_file_path_or_raise(self.project_path)
-            with settings_file.open() as f:
-                settings = yaml.safe_load(f)
+            settings = load_settings(settings_file)
             self.python_version = settings.get("python_version", INSTALLED_PYTHON_VERSION)
 
-        # Create virtual environment
-        venv_path = self.verify_or_create_venv(
+        # Create virtual environment and download the constraints file at the same time
+        venv_path, constraints_file = self._create_venv_and_download_constraints(
             venv_path=venv_path,
-            recreate=recreate_venv,
-            python_version=self.python_version,
+            recreate_venv=recreate_venv,
         )
 
         # Install Airflow and dependencies
@@ -78,6 +141,7 @@ class VirtualenvMode:
             venv_path=str(venv_path),
             python_version=self.python_version,
             project_path=self.project_path,
+            constraints_file=constraints_file,
         )
 
         # add venv_path to config.yaml
@@ -90,6 +154,22 @@ class VirtualenvMode:
 
         return venv_path
 
+    def _create_venv_and_download_constraints(
+        self, venv_path: str, recreate_venv: bool
+    ) -> tuple[Path, Path | None]:
+        """Create the virtual environment and download the constraints file in parallel."""
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            venv_future = executor.submit(
+                self.verify_or_create_venv,
+                venv_path=venv_path,
+                recreate=recreate_venv,
+                python_version=self.python_version,
+            )
+            constraints_future = executor.submit(
+                download_constraints, self.airflow_version, self.python_version
+            )
+            return venv_future.result(), constraints_future.result()
+
     def has_built(self) -> bool:
         return self.venv_path.exists()
 
@@ -103,16 +183,18 @@ class VirtualenvMode:
         self._setup_env_vars_to_run_airflow()
 
         activate_cmd = activate_virtualenv_cmd(self.venv_path)
+        venv_bin_airflow = str(self.venv_path / "bin" / "airflow")
+        venv_env = self._get_venv_env()
+
+        if not Path(venv_bin_airflow).is_file():
+            typer.echo(f"Error starting Airflow: {venv_bin_airflow} not found. Run 'airflowctl build' first.")
+            raise typer.Exit(1)
 
         try:
             # Verify that Airflow is installed and get the version
             print("Verifying Airflow installation...")
-            subprocess.run(
-                f"{activate_cmd} && airflow db upgrade && airflow version",
-                shell=True,
-                check=True,
-                env=os.environ,
-            )
+            subprocess.run([venv_bin_airflow, "db", "upgrade"], check=True, env=venv_env)
+            subprocess.run([venv_bin_airflow, "version"], check=True, env=venv_env)
 
             # Add connections
             add_connections(project_path, activate_cmd)
@@ -120,42 +202,34 @@ class VirtualenvMode:
             # Add variables
             add_variables(project_path, activate_cmd)
 
-            # Activate the virtual environment and then run the airflow command
+            # Replace the current process with Airflow, so that signals (e.g. Ctrl+C) reach it directly
             if not background:
-                subprocess.run(
-                    f"{activate_cmd} && airflow standalone", shell=True, check=True, env=os.environ
-                )
+                os.execve(venv_bin_airflow, ["airflow", "standalone"], venv_env)
                 return
 
             if not self.background_process_ids_file.exists():
                 self.background_process_ids_file.parent.mkdir(parents=True, exist_ok=True)
                 self.background_process_ids_file.touch()
 
-            bg_process_file = str(self.background_process_ids_file.resolve())
-
             # Create a temporary file to capture the logs
             with tempfile.NamedTemporaryFile(mode="w+", delete=False) as temp_file:
                 # Save the temporary file name to a known location
                 self.background_logs_info_file.write_text(temp_file.name)
 
-                # Activate the virtual environment and then run the airflow command in the background
-                subprocess.Popen(
-                    f"{activate_cmd} && airflow standalone > {temp_file.name} 2>&1 & echo $! > {bg_process_file}",
-                    shell=True,
-                    env=os.environ,
+                # Run the airflow command in the background, detached from the terminal session
+                bg_process = subprocess.Popen(
+                    [venv_bin_airflow, "standalone"],
+                    stdout=temp_file,
+                    stderr=subprocess.STDOUT,
+                    env=venv_env,
+                    start_new_session=True,
                 )
+                self.background_process_ids_file.write_text(str(bg_process.pid))
 
-                # Wait for a bit to ensure the subprocesses are started
-                time.sleep(5)
-
-                # Read the background process PID
-                with open(bg_process_file) as f:
-                    bg_process_pid = int(f.read())
-
-                print(f"Airflow is starting in the background (PID: {bg_process_pid}).")
+                print(f"Airflow is starting in the background (PID: {bg_process.pid}).")
                 print("Logs are being captured. You can use 'airflowctl logs' to view the logs.")
 
-        except subprocess.CalledProcessError as e:
+        except (subprocess.CalledProcessError, OSError) as e:
             typer.echo(f"Error starting Airflow: {e}")
             raise typer.Exit(1)
 
@@ -164,6 +238,8 @@ class VirtualenvMode:
             typer.echo("No background logs found.")
             raise typer.Exit(1)
 
+        from rich.console import Console
+
         temp_file_name = self.background_logs_info_file.read_text().strip()
         try:
             console = Console()
@@ -243,8 +319,7 @@ class VirtualenvMode:
         venv_path = venv_path.absolute() if venv_path.exists() else "N/A"
 
         settings_file = get_settings_file_path_or_raise(project_path=self.project_path)
-        with open(settings_file) as f:
-            settings = yaml.safe_load(f) or {}
+        settings = load_settings(settings_file)
 
         python_version = settings.get("python_version", "N/A")
         airflow_version = settings.get("airflow_version", "N/A")
@@ -320,6 +395,16 @@ class VirtualenvMode:
         except psutil.NoSuchProcess:
             pass
 
+    def _get_venv_env(self) -> dict[str, str]:
+        """Get the environment variables that activating the virtual environment would set."""
+        env = {
+            **os.environ,
+            "PATH": f"{self.venv_path / 'bin'}{os.pathsep}{os.environ.get('PATH', '')}",
+            "VIRTUAL_ENV": str(self.venv_path),
+        }
+        env.pop("PYTHONHOME", None)
+        return env
+
     def _setup_env_vars_to_run_airflow(self):
         # Source the .env file to set environment variables
         source_env_file(self.env_file)
@@ -328,8 +413,7 @@ class VirtualenvMode:
         # Run LocalExecutor for Airflow 2.6
         if not self.airflow_version:
             settings_file = get_settings_file_path_or_raise(self.project_path)
-            with settings_file.open() as f:
-                settings = yaml.safe_load(f)
+            settings = load_settings(settings_file)
             self.airflow_version = settings.get("airflow_version")
 
             # if self.airflow_version is a file or a directory, then it is a path to Airflow source code
@@ -352,12 +436,12 @@ class VirtualenvMode:
         if isinstance(venv_path, str):
             venv_path = Path(venv_path).absolute()
 
-        if recreate and os.path.exists(venv_path):
+        if recreate and venv_path.exists():
             print(f"Recreating virtual environment at [bold blue]{venv_path}[/bold blue]")
             shutil.rmtree(venv_path)
 
-        venv_bin_python = os.path.join(venv_path, "bin", "python")
-        if os.path.exists(venv_path) and not os.path.exists(venv_bin_python):
+        venv_bin_python = venv_path / "bin" / "python"
+        if venv_path.exists() and not venv_bin_python.exists():
             print(f"[bold red]Virtual environment at {venv_path} does not exist or is not valid.[/bold red]")
             raise SystemExit()
 
@@ -367,8 +451,8 @@ class VirtualenvMode:
             )
             cls.create_virtualenv_with_specific_python_version(venv_path, python_version)
 
-        if not os.path.exists(venv_path):
-            venv.create(venv_path, with_pip=True)
+        if not venv_path.exists():
+            FastEnvBuilder().create(venv_path)
             print(f"Virtual environment created at [bold blue]{venv_path}[/bold blue]")
 
         return venv_path
@@ -433,6 +517,8 @@ def activate_virtualenv_cmd(venv_path: Path | str) -> str:
 
 
 def source_env_file(env_file: str | Path):
+    from dotenv import load_dotenv
+
     try:
         load_dotenv(env_file)
     except Exception as e:
@@ -1,62 +1,227 @@
 from __future__ import annotations
 
+import atexit
+import importlib.util
+import json
 import os
+import shlex
+import shutil
 import subprocess
+import tempfile
+import threading
+import time
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import httpx
 from rich import print
 
+from airflowctl.utils.paths import GLOBAL_CONFIG_DIR
 
-def get_airflow_versions(verbose: bool = False) -> list[str]:
-    with httpx.Client() as client:
-        response = client.get("https://pypi.org/pypi/apache-airflow/json")
-        data = response.json()
-        versions = list(data["releases"].keys())
-        if verbose:
-            print(f"Apache Airflow versions detected: [bold cyan]{versions}[/bold cyan]")
-        return versions
+if TYPE_CHECKING:
+    import httpx
 
+AIRFLOW_PYPI_URL = "https://pypi.org/pypi/apache-airflow/json"
+PYPI_CACHE_FILE = GLOBAL_CONFIG_DIR / "pypi_cache.json"
+# The latest Airflow version changes rarely, so a day old value is good enough
+PYPI_CACHE_TTL_SECONDS = 24 * 60 * 60
+# How long the process waits at exit for a background refresh of the PyPI cache to finish
+PYPI_CACHE_REFRESH_EXIT_TIMEOUT_SECONDS = 5.0
+CONSTRAINTS_CACHE_DIR = GLOBAL_CONFIG_DIR / "constraints"
 
-def get_latest_airflow_version(verbose: bool = False) -> str:
+
+_http_client: httpx.Client | None = None
+_http_client_lock = threading.Lock()
+
+
+def get_http_client() -> httpx.Client:
+    """
+    Get the HTTP client shared by all requests made by airflowctl, so that connections (and TLS
+    sessions) to the same host are reused. HTTP/2 is used if the optional ``h2`` package is installed.
+    """
+    global _http_client
+
+    # The client is first requested from worker threads (e.g. during build), so create it under a lock
+    with _http_client_lock:
+        if _http_client is None:
+            import httpx
+
+            _http_client = httpx.Client(
+                http2=importlib.util.find_spec("h2") is not None,
+                timeout=10.0,
+                follow_redirects=True,
+                headers={"User-Agent": "airflowctl"},
+            )
+        return _http_client
+
+
+def _fetch_airflow_pypi_metadata() -> dict:
+    """Fetch Apache Airflow metadata from PyPI and store the relevant bits in the cache file."""
+    response = get_http_client().get(AIRFLOW_PYPI_URL)
+    response.raise_for_status()
+    data = response.json()
+
+    metadata = {"version": data["info"]["version"], "releases": list(data["releases"].keys())}
+    try:
+        atomic_write_bytes(PYPI_CACHE_FILE, json.dumps(metadata).encode())
+    except OSError:
+        pass
+    return metadata
+
+
+def atomic_write_bytes(path: Path, data: bytes):
+    """
+    Write to a unique temporary file next to ``path`` and move it into place, so that readers never see
+    a partially written file, even when several writers race.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_file = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp")
     try:
-        with httpx.Client() as client:
-            response = client.get("https://pypi.org/pypi/apache-airflow/json")
-            data = response.json()
-            latest_version = data["info"]["version"]
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_file, path)
+    except BaseException:
+        os.unlink(tmp_file)
+        raise
+
+
+def _read_airflow_pypi_cache() -> tuple[dict | None, bool]:
+    """Return the cached PyPI metadata (if any) and whether it is still fresh."""
+    try:
+        age = time.time() - PYPI_CACHE_FILE.stat().st_mtime
+        metadata = json.loads(PYPI_CACHE_FILE.read_text())
+    except (OSError, ValueError):
+        return None, False
+    return metadata, age < PYPI_CACHE_TTL_SECONDS
+
+
+# Background refresh of the PyPI cache started by this process, if any
+_pypi_cache_refresh_thread: threading.Thread | None = None
+
+
+def _refresh_airflow_pypi_cache_in_background():
+    global _pypi_cache_refresh_thread
+    if _pypi_cache_refresh_thread is not None:
+        # Only refresh once per process
+        return
+
+    def _refresh():
+        import httpx
+
+        try:
+            _fetch_airflow_pypi_metadata()
+        except (httpx.HTTPError, KeyError, ValueError):
+            # Keep serving the stale value
+            pass
+
+    _pypi_cache_refresh_thread = threading.Thread(target=_refresh, daemon=True)
+    _pypi_cache_refresh_thread.start()
+    # Daemon threads are killed when the interpreter exits, give the refresh a chance to finish
+    # writing the cache instead of leaving it stale (and a temporary file behind) forever
+    atexit.register(_wait_for_pypi_cache_refresh)
+
+
+def _wait_for_pypi_cache_refresh(timeout: float = PYPI_CACHE_REFRESH_EXIT_TIMEOUT_SECONDS):
+    if _pypi_cache_refresh_thread is not None:
+        _pypi_cache_refresh_thread.join(timeout=timeout)
+
+
+def get_airflow_versions(verbose: bool = False, required_version: str | None = None) -> list[str]:
+    """
+    Get the released Apache Airflow versions. The cached list is used unless there is no cache or it does
+    not contain ``required_version``, in which case the list is fetched from PyPI.
+    """
+    metadata, is_fresh = _read_airflow_pypi_cache()
+    versions = (metadata or {}).get("releases")
+    if versions and (not required_version or required_version in versions):
+        if not is_fresh:
+            _refresh_airflow_pypi_cache_in_background()
+    elif _pypi_cache_refresh_thread is not None:
+        # A refresh is already fetching the same data, wait for it instead of fetching it twice
+        _pypi_cache_refresh_thread.join()
+        metadata, _ = _read_airflow_pypi_cache()
+        versions = (metadata or {}).get("releases") or _fetch_airflow_pypi_metadata()["releases"]
+    else:
+        versions = _fetch_airflow_pypi_metadata()["releases"]
+
+    if verbose:
+        print(f"Apache Airflow versions detected: [bold cyan]{versions}[/bold cyan]")
+    return versions
+
+
+def get_latest_airflow_version(verbose: bool = False) -> str:
+    metadata, is_fresh = _read_airflow_pypi_cache()
+    if metadata and metadata.get("version"):
+        # Serve the cached value right away and revalidate it in the background if it is stale
+        if not is_fresh:
+            _refresh_airflow_pypi_cache_in_background()
+        latest_version = metadata["version"]
+    else:
+        import httpx
+
+        try:
+            latest_version = _fetch_airflow_pypi_metadata()["version"]
+        except (httpx.HTTPError, KeyError, ValueError) as e:
             if verbose:
-                print(f"Latest Apache Airflow version detected: [bold cyan]{latest_version}[/bold cyan]")
-            return latest_version
-    except (httpx.RequestError, KeyError) as e:
-        if verbose:
-            print(f"[bold red]Error occurred while retrieving latest version: {e}[/bold red]")
-            print("[bold yellow]Defaulting to Apache Airflow version 2.7.0[/bold yellow]")
-        return "2.7.0"
+                print(f"[bold red]Error occurred while retrieving latest version: {e}[/bold red]")
+                print("[bold yellow]Defaulting to Apache Airflow version 2.7.0[/bold yellow]")
+            return "2.7.0"
+
+    if verbose:
+        print(f"Latest Apache Airflow version detected: [bold cyan]{latest_version}[/bold cyan]")
+    return latest_version
+
 
+def get_installed_airflow_version(venv_path: str | Path) -> str | None:
+    """Read the installed Airflow version from the package metadata, without importing Airflow."""
+    for metadata_file in Path(venv_path).glob(
+        "lib/python*/site-packages/apache_airflow-*.dist-info/METADATA"
+    ):
+        with metadata_file.open(encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("Version:"):
+                    return line.split(":", 1)[1].strip()
+                if not line.strip():
+                    # End of the metadata headers
+                    break
+    return None
 
-def is_airflow_installed(venv_path: str, airflow_version, project_path: Path) -> bool:
-    venv_bin_airflow = os.path.join(venv_path, "bin", "airflow")
-    if not os.path.exists(venv_bin_airflow):
+
+def is_airflow_installed(venv_path: str, airflow_version, project_path: Path, verify: bool = False) -> bool:
+    """
+    Check if the given Airflow version is installed in the virtual environment. By default, only the
+    package metadata is checked. Set ``verify`` to run ``airflow version`` instead, which is much slower
+    as it imports Airflow.
+    """
+    venv_bin_airflow = Path(venv_path) / "bin" / "airflow"
+    if not venv_bin_airflow.is_file():
         return False
 
-    try:
-        completed_process = subprocess.run([venv_bin_airflow, "version"], stdout=subprocess.PIPE, text=True)
-        installed_version = completed_process.stdout.strip()
-        if installed_version == airflow_version:
-            return True
-        else:
-            print(
-                f"[bold yellow]Apache Airflow {installed_version} is installed. "
-                f"Apache Airflow {airflow_version} is required.[/bold yellow]"
+    if verify:
+        try:
+            completed_process = subprocess.run(
+                [venv_bin_airflow, "version"], stdout=subprocess.PIPE, text=True, check=True
             )
-            # Remove airflow.db if it exists to prevent conflicts with DB migrations
-            airflow_db_path = project_path / "airflow.db"
-            if airflow_db_path.exists():
-                airflow_db_path.unlink()
-
+        except subprocess.CalledProcessError:
             return False
-    except subprocess.CalledProcessError:
-        return False
+        installed_version = completed_process.stdout.strip()
+    else:
+        installed_version = get_installed_airflow_version(venv_path)
+        if not installed_version:
+            return False
+
+    if installed_version == airflow_version:
+        return True
+
+    print(
+        f"[bold yellow]Apache Airflow {installed_version} is installed. "
+        f"Apache Airflow {airflow_version} is required.[/bold yellow]"
+    )
+    # Remove airflow.db if it exists to prevent conflicts with DB migrations
+    airflow_db_path = project_path / "airflow.db"
+    if airflow_db_path.exists():
+        airflow_db_path.unlink()
+
+    return False
 
 
 def install_airflow(
@@ -68,6 +233,7 @@ def install_airflow(
     requirements: bool = True,
     pip_provider: str = "pip",
     verbose: bool = False,
+    constraints_file: str | Path | None = None,
 ):
     if is_airflow_installed(venv_path, version, project_path=project_path):
         print(
@@ -75,46 +241,39 @@ def install_airflow(
         )
         return
 
-    venv_bin_python = os.path.join(venv_path, "bin", "python")
-    if not os.path.exists(venv_bin_python):
+    venv_bin_python = Path(venv_path) / "bin" / "python"
+    if not venv_bin_python.exists():
         print(f"[bold red]Virtual environment at {venv_path} does not exist or is not valid.[/bold red]")
         raise SystemExit()
 
-    upgrade_pipeline_command = f"{venv_bin_python} -m {pip_provider} install --upgrade pip setuptools wheel"
-
-    constraints_url = os.getenv("AIRFLOWCTL_CONSTRAINTS")
-
-    install_command = f"{upgrade_pipeline_command} && {venv_bin_python} -m {pip_provider} install "
+    # Install Airflow and the project requirements with a single installer process. pip itself is
+    # upgraded when the virtual environment is created.
+    install_command = _get_install_command(str(venv_bin_python), pip_provider)
 
     if requirements:
-        install_command += f" -r {os.path.join(project_path, 'requirements.txt')}"
+        install_command += ["-r", str(project_path / "requirements.txt")]
 
     extra_pip_flags = os.getenv("AIRFLOWCTL_PIP_FLAGS")
     if extra_pip_flags:
-        install_command += f" {extra_pip_flags}"
+        install_command += shlex.split(extra_pip_flags)
 
     # Check if version is a local path
     is_local_path = Path(version).exists()
 
     if is_local_path:
-        install_command = f"{install_command} . "
+        install_command.append(".")
     else:
-        install_command = f"{install_command} 'apache-airflow=={version}{extras}' "
-        constraints_url = constraints_url or (
-            f"https://raw.githubusercontent.com/apache/airflow/"
-            f"constraints-{version}/constraints-{_get_major_minor_version(python_version)}.txt"
-        )
+        install_command.append(f"apache-airflow=={version}{extras}")
 
-    if constraints_url and not os.getenv("AIRFLOWCTL_SKIP_CONSTRAINTS"):
-        install_command += f" --constraint {constraints_url} "
+    # Prefer an already downloaded constraints file over the URL
+    constraints = constraints_file or get_constraints_url(version, python_version)
+    if constraints:
+        install_command += ["--constraint", str(constraints)]
 
     try:
         if verbose:
-            print(f"Running command: [bold]{install_command}[/bold]")
-        if is_local_path:
-            subprocess.run(install_command, shell=True, check=True, cwd=version)
-        else:
-            subprocess.run(install_command, shell=True, check=True)
+            print(f"Running command: [bold]{shlex.join(install_command)}[/bold]")
+        subprocess.run(install_command, check=True, cwd=version if is_local_path else None)
         print(f"[bold green]Apache Airflow {version} installed successfully![/bold green]")
         print(f"Virtual environment at {venv_path}")
     except subprocess.CalledProcessError:
@@ -122,6 +281,67 @@ def install_airflow(
         raise SystemExit()
 
 
+def get_constraints_url(version: str, python_version: str) -> str | None:
+    """Get the constraints URL (or path) for the given Airflow version, if any."""
+    if os.getenv("AIRFLOWCTL_SKIP_CONSTRAINTS"):
+        return None
+
+    constraints_url = os.getenv("AIRFLOWCTL_CONSTRAINTS")
+    # No default constraints when installing Airflow from a local path
+    if constraints_url or Path(version).exists():
+        return constraints_url
+
+    return _get_default_constraints_url(version, python_version)
+
+
+def download_constraints(version: str, python_version: str) -> Path | None:
+    """
+    Download the default constraints file into a cache shared by all projects, so that pip doesn't
+    have to fetch it on every build. The constraints of a released Airflow version never change, so
+    the cached file is reused as is. Returns None if custom constraints are used or the download
+    failed, in which case pip uses the URL directly.
+    """
+    constraints_url = get_constraints_url(version, python_version)
+    if not constraints_url or constraints_url != _get_default_constraints_url(version, python_version):
+        return None
+
+    cache_path = (
+        CONSTRAINTS_CACHE_DIR / f"constraints-{version}-{_get_major_minor_version(python_version)}.txt"
+    )
+    if cache_path.exists():
+        return cache_path
+
+    import httpx
+
+    try:
+        response = get_http_client().get(constraints_url)
+        response.raise_for_status()
+        atomic_write_bytes(cache_path, response.content)
+    except (httpx.HTTPError, OSError):
+        return None
+    return cache_path
+
+
+def _get_default_constraints_url(version: str, python_version: str) -> str:
+    return (
+        f"https://raw.githubusercontent.com/apache/airflow/"
+        f"constraints-{version}/constraints-{_get_major_minor_version(python_version)}.txt"
+    )
+
+
+def _get_install_command(venv_bin_python: str, pip_provider: str) -> list[str]:
+    """Get the base command used to install packages in the virtual environment."""
+    if pip_provider == "uv pip":
+        # Use the uv binary directly and point it at the venv, no need to have uv installed in the venv
+        uv_bin = shutil.which("uv")
+        if uv_bin:
+            return [uv_bin, "pip", "install", "--python", venv_bin_python]
+        print("[bold yellow]uv not found. Falling back to pip.[/bold yellow]")
+        pip_provider = "pip"
+
+    return [venv_bin_python, "-m", *pip_provider.split(), "install"]
+
+
 def _get_major_minor_version(python_version: str) -> str:
     major, minor = map(int, python_version.split(".")[:2])
     return f"{major}.{minor}"
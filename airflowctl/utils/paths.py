@@ -2,6 +2,9 @@ from __future__ import annotations
 
 from pathlib import Path
 
+# Directory for storing airflowctl internal state shared across projects
+GLOBAL_CONFIG_DIR = Path.home() / ".airflowctl"
+
 
 def convert_str_or_path_to_absolute_path(str_or_path: str | Path) -> Path:
     if isinstance(str_or_path, Path):
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import os
 import shutil
 import sys
@@ -10,10 +11,76 @@ import yaml
 from rich import print
 
 from airflowctl.utils.install_airflow import get_airflow_versions, get_latest_airflow_version
+from airflowctl.utils.paths import GLOBAL_CONFIG_DIR
+
+try:
+    # Use the LibYAML-backed loader when available, it is much faster than the pure-Python one
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as YamlLoader
 
 INSTALLED_PYTHON_VERSION = f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
 
 
+GITIGNORE_CONTENTS = """
+.git
+airflow.cfg
+airflow.db
+airflow-webserver.pid
+webserver_config.py
+logs
+standalone_admin_password.txt
+.DS_Store
+__pycache__/
+.env
+.venv
+.airflowctl
+""".strip()
+
+SETTINGS_TEMPLATE = """
+# Airflow version to be installed
+airflow_version: "{airflow_version}"
+
+# Python version for the project
+python_version: "{python_version}"
+
+# Path to a virtual env
+mode:
+  name: "uv"
+  config:
+    venv_path: "{venv_path}"
+
+# Airflow connections
+connections:
+    # Example connection
+    # - conn_id: example
+    #   conn_type: http
+    #   host: http://example.com
+    #   port: 80
+    #   login: user
+    #   password: pass
+    #   schema: http
+    #   extra:
+    #      example_extra_field: example-value
+
+# Airflow variables
+variables:
+    # Example variable
+    # - key: example
+    #   value: example-value
+    #   description: example-description
+""".strip()
+
+ENV_TEMPLATE = """
+AIRFLOW_HOME={project_dir}
+AIRFLOW__CORE__LOAD_EXAMPLES=False
+AIRFLOW__CORE__FERNET_KEY=d6Vefz3G9U_ynXB3cr7y_Ak35tAHkEGAVxuz_B-jzWw=
+AIRFLOW__WEBSERVER__WORKERS=2
+AIRFLOW__WEBSERVER__SECRET_KEY=secret
+AIRFLOW__WEBSERVER__EXPOSE_CONFIG=True
+""".strip()
+
+
 def copy_example_dags(project_path: Path):
     from_dir = Path(__file__).parent.parent / "dags"
     assert from_dir.exists()
@@ -23,13 +90,12 @@ def copy_example_dags(project_path: Path):
         # Skip if dags directory already exists
         return
 
-    # Create the dags directory
-    to_dir.mkdir(exist_ok=True)
+    # Create the dags directory with the *.py files from example dags directory
+    shutil.copytree(from_dir, to_dir, ignore=_ignore_non_py_files, copy_function=shutil.copy)
 
-    # Copy *.py files from example dags directory
-    for file in from_dir.iterdir():
-        if file.suffix == ".py":
-            shutil.copy(file, to_dir)
+
+def _ignore_non_py_files(src: str, names: list[str]) -> list[str]:
+    return [name for name in names if not name.endswith(".py") or not (Path(src) / name).is_file()]
 
 
 def create_project(
@@ -44,7 +110,7 @@ def create_project(
     GLOBAL_TRACKING_FILE.touch(exist_ok=True)
 
     if not os.getenv("AIRFLOWCTL_SKIP_VERSION_CHECK"):
-        available_airflow_vers = get_airflow_versions()
+        available_airflow_vers = get_airflow_versions(required_version=airflow_version)
         if airflow_version not in available_airflow_vers and not Path(airflow_version).exists():
             print(f"Apache Airflow version [bold red]{airflow_version}[/bold red] not found.")
             print(f"Please select a valid version from the list below: {available_airflow_vers}")
@@ -52,10 +118,11 @@ def create_project(
 
     # Create the project directory
     project_dir = Path(project_path).absolute()
+    created_project_dir = not project_dir.exists()
     project_dir.mkdir(exist_ok=True)
 
-    # if directory is not empty, prompt user to confirm
-    if any(project_dir.iterdir()):
+    # if directory is not empty, prompt user to confirm. A freshly created directory is always empty.
+    if not created_project_dir and any(project_dir.iterdir()):
         typer.confirm(
             f"Directory {project_dir} is not empty. Continue?",
             abort=True,
@@ -68,7 +135,6 @@ def create_project(
     project_config_dir = project_dir / ".airflowctl"
     project_config_dir.mkdir(exist_ok=True)
     project_config_yaml = project_config_dir / "config.yaml"
-    project_config_yaml.touch(exist_ok=True)
 
     if not project_name:
         project_name = str(project_dir)
@@ -79,90 +145,35 @@ def create_project(
     copy_example_dags(project_dir)
 
     # Create the plugins directory
-    plugins_dir = Path(project_dir / "plugins")
+    plugins_dir = project_dir / "plugins"
     plugins_dir.mkdir(exist_ok=True)
 
     # Create requirements.txt
-    requirements_file = Path(project_dir / "requirements.txt")
+    requirements_file = project_dir / "requirements.txt"
     requirements_file.touch(exist_ok=True)
 
     # Create .gitignore
-    gitignore_file = Path(project_dir / ".gitignore")
-    gitignore_file.touch(exist_ok=True)
-    with open(gitignore_file, "w") as f:
-        f.write(
-            """
-.git
-airflow.cfg
-airflow.db
-airflow-webserver.pid
-webserver_config.py
-logs
-standalone_admin_password.txt
-.DS_Store
-__pycache__/
-.env
-.venv
-.airflowctl
-""".strip()
-        )
+    (project_dir / ".gitignore").write_text(GITIGNORE_CONTENTS)
 
     # Initialize the settings file
-    settings_file = Path(project_dir / SETTINGS_FILENAME)
+    settings_file = project_dir / SETTINGS_FILENAME
 
     # Check if the project is an Astro project and use the Astro settings file
     if is_astro_project(project_dir):
-        settings_file = Path(project_dir / ASTRO_SETTINGS_FILENAME)
+        settings_file = project_dir / ASTRO_SETTINGS_FILENAME
 
     venv_path = Path(venv_path).absolute() if venv_path else f"{project_dir}/.venv"
     if not settings_file.exists():
-        file_contents = f"""
-# Airflow version to be installed
-airflow_version: "{airflow_version}"
-
-# Python version for the project
-python_version: "{python_version}"
-
-# Path to a virtual env
-mode:
-  name: "uv"
-  config:
-    venv_path: "{venv_path}"
-
-# Airflow connections
-connections:
-    # Example connection
-    # - conn_id: example
-    #   conn_type: http
-    #   host: http://example.com
-    #   port: 80
-    #   login: user
-    #   password: pass
-    #   schema: http
-    #   extra:
-    #      example_extra_field: example-value
-
-# Airflow variables
-variables:
-    # Example variable
-    # - key: example
-    #   value: example-value
-    #   description: example-description
-        """
-        settings_file.write_text(file_contents.strip())
+        settings_file.write_text(
+            SETTINGS_TEMPLATE.format(
+                airflow_version=airflow_version, python_version=python_version, venv_path=venv_path
+            )
+        )
 
     # Initialize the .env file
-    env_file = Path(project_dir / ".env")
+    env_file = project_dir / ".env"
     if not env_file.exists():
-        file_contents = f"""
-AIRFLOW_HOME={project_dir}
-AIRFLOW__CORE__LOAD_EXAMPLES=False
-AIRFLOW__CORE__FERNET_KEY=d6Vefz3G9U_ynXB3cr7y_Ak35tAHkEGAVxuz_B-jzWw=
-AIRFLOW__WEBSERVER__WORKERS=2
-AIRFLOW__WEBSERVER__SECRET_KEY=secret
-AIRFLOW__WEBSERVER__EXPOSE_CONFIG=True
-"""
-        env_file.write_text(file_contents.strip())
+        env_file.write_text(ENV_TEMPLATE.format(project_dir=project_dir))
     typer.echo(f"Airflow project initialized in {project_dir}")
     return project_dir, settings_file
 
@@ -201,15 +212,23 @@ def airflowctl_project_check(project_path: str | Path):
 
 SETTINGS_FILENAME = "settings.yaml"
 ASTRO_SETTINGS_FILENAME = "airflow_settings.yaml"
-GLOBAL_CONFIG_DIR = Path.home() / ".airflowctl"
 GLOBAL_TRACKING_FILE = GLOBAL_CONFIG_DIR / "tracked_projects.yaml"
 
 
-def get_conf_or_raise(key: str, settings: dict) -> str:
-    if key not in settings:
-        typer.echo(f"Key '{key}' not found in settings file.")
-        raise typer.Exit(1)
-    return settings[key]
+def load_settings(settings_file: str | Path) -> dict:
+    """
+    Load the settings file. The same file is read multiple times per command, so the parsed settings
+    are cached until the file changes. The returned dict is shared and must not be modified.
+    """
+    settings_file = Path(settings_file).absolute()
+    stat = settings_file.stat()
+    return _load_settings(settings_file, stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_settings(settings_file: Path, mtime_ns: int, size: int) -> dict:
+    with settings_file.open() as f:
+        return yaml.load(f, Loader=YamlLoader) or {}
 
 
 def is_astro_project(project_path: Path) -> bool:
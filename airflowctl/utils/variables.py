@@ -5,17 +5,15 @@ import subprocess
 from pathlib import Path
 
 import typer
-import yaml
 from rich import print
 
-from airflowctl.utils.project import get_settings_file_path_or_raise, is_astro_project
+from airflowctl.utils.project import get_settings_file_path_or_raise, is_astro_project, load_settings
 
 
 def add_variables(project_path: Path, activate_cmd: str):
     settings_yaml = get_settings_file_path_or_raise(project_path=project_path)
 
-    with open(settings_yaml) as f:
-        settings = yaml.safe_load(f)
+    settings = load_settings(settings_yaml)
 
     variables = settings.get("variables", []) or []
 
@@ -1,13 +1,18 @@
+import os
 import subprocess
+import tempfile
 from pathlib import Path
 from unittest import mock
 
+import httpx
 import pytest
 import typer
 
 from airflowctl.modes.virtualenv import (
     VirtualenvMode,
     activate_virtualenv_cmd,
+    bootstrap_pip,
+    get_pip_zipapp,
     source_env_file,
 )
 
@@ -33,7 +38,7 @@ def test_activate_virtualenv_cmd_unsupported_os():
 def test_source_env_file_success():
     env_file = "/path/to/.env"
 
-    with mock.patch("airflowctl.modes.virtualenv.load_dotenv") as load_dotenv_mock:
+    with mock.patch("dotenv.load_dotenv") as load_dotenv_mock:
         source_env_file(env_file)
 
     load_dotenv_mock.assert_called_once_with(env_file)
@@ -43,7 +48,7 @@ def test_source_env_file_error():
     env_file = "/path/to/.env"
     exception_message = "Mocked exception message"
 
-    with mock.patch("airflowctl.modes.virtualenv.load_dotenv", side_effect=Exception(exception_message)):
+    with mock.patch("dotenv.load_dotenv", side_effect=Exception(exception_message)):
         with pytest.raises(typer.Exit):
             source_env_file(env_file)
 
@@ -92,3 +97,162 @@ def test_create_virtualenv_with_specific_python_version_pyenv_not_available():
     with mock.patch("shutil.which", return_value=None):
         with pytest.raises(typer.Exit):
             VirtualenvMode.create_virtualenv_with_specific_python_version(venv_path, python_version)
+
+
+def test_get_pip_zipapp(tmp_path):
+    with mock.patch("airflowctl.modes.virtualenv.GLOBAL_CONFIG_DIR", tmp_path):
+        assert get_pip_zipapp((3, 11)) == ("https://bootstrap.pypa.io/pip/pip.pyz", tmp_path / "pip.pyz")
+        assert get_pip_zipapp((3, 8)) == (
+            "https://bootstrap.pypa.io/pip/3.8/pip.pyz",
+            tmp_path / "pip-3.8.pyz",
+        )
+
+
+def test_bootstrap_pip_uses_cached_zipapp(tmp_path):
+    pip_zipapp_file = tmp_path / "pip.pyz"
+    pip_zipapp_file.touch()
+
+    with mock.patch("airflowctl.modes.virtualenv.GLOBAL_CONFIG_DIR", tmp_path), mock.patch(
+        "httpx.Client.get"
+    ) as httpx_get_mock, mock.patch("subprocess.run") as subprocess_run_mock:
+        bootstrap_pip("/path/to/venv/bin/python", (3, 11))
+
+    httpx_get_mock.assert_not_called()
+    subprocess_run_mock.assert_called_once_with(
+        ["/path/to/venv/bin/python", str(pip_zipapp_file), "install", "--upgrade", "pip", "setuptools"],
+        check=True,
+    )
+
+
+def test_bootstrap_pip_downloads_versioned_zipapp(tmp_path):
+    # The cached zipapp of the latest pip must not be used for an older Python
+    (tmp_path / "pip.pyz").touch()
+    response = mock.Mock(content=b"zipapp")
+
+    with mock.patch("airflowctl.modes.virtualenv.GLOBAL_CONFIG_DIR", tmp_path), mock.patch(
+        "httpx.Client.get", return_value=response
+    ) as httpx_get_mock, mock.patch("subprocess.run") as subprocess_run_mock:
+        bootstrap_pip("/path/to/venv/bin/python", (3, 8))
+
+    httpx_get_mock.assert_called_once_with("https://bootstrap.pypa.io/pip/3.8/pip.pyz")
+    assert (tmp_path / "pip-3.8.pyz").read_bytes() == b"zipapp"
+    subprocess_run_mock.assert_called_once_with(
+        [
+            "/path/to/venv/bin/python",
+            str(tmp_path / "pip-3.8.pyz"),
+            "install",
+            "--upgrade",
+            "pip",
+            "setuptools",
+        ],
+        check=True,
+    )
+
+
+def test_bootstrap_pip_falls_back_to_ensurepip(tmp_path):
+    with mock.patch("airflowctl.modes.virtualenv.GLOBAL_CONFIG_DIR", tmp_path), mock.patch(
+        "httpx.Client.get", side_effect=httpx.ConnectError("offline")
+    ), mock.patch("subprocess.run") as subprocess_run_mock:
+        bootstrap_pip("/path/to/venv/bin/python", (3, 11))
+
+    subprocess_run_mock.assert_called_once_with(
+        ["/path/to/venv/bin/python", "-m", "ensurepip", "--upgrade"], check=True
+    )
+
+
+def test_build_propagates_venv_creation_failure(tmp_path):
+    mode = VirtualenvMode(
+        project_path=tmp_path,
+        python_version="3.11.7",
+        airflow_version="2.10.0",
+        venv_path=str(tmp_path / ".venv"),
+    )
+
+    with mock.patch.object(VirtualenvMode, "verify_or_create_venv", side_effect=typer.Exit(1)), mock.patch(
+        "airflowctl.modes.virtualenv.download_constraints", return_value=None
+    ) as download_constraints_mock, mock.patch("airflowctl.modes.virtualenv.install_airflow") as install_mock:
+        with pytest.raises(typer.Exit):
+            mode.build()
+
+    download_constraints_mock.assert_called_once_with("2.10.0", "3.11.7")
+    install_mock.assert_not_called()
+
+
+def test_get_venv_env(tmp_path):
+    mode = VirtualenvMode(project_path=tmp_path, venv_path=str(tmp_path / ".venv"))
+
+    with mock.patch.dict("os.environ", {"PATH": "/usr/bin", "PYTHONHOME": "/python/home"}, clear=True):
+        env = mode._get_venv_env()
+
+    assert env["PATH"] == f"{tmp_path / '.venv' / 'bin'}{os.pathsep}/usr/bin"
+    assert env["VIRTUAL_ENV"] == str(tmp_path / ".venv")
+    assert "PYTHONHOME" not in env
+
+
+def _create_built_project(tmp_path, monkeypatch):
+    # start() sets AIRFLOW_HOME and writes the background logs to a temporary file, keep both
+    # contained to the test
+    monkeypatch.delenv("AIRFLOW_HOME", raising=False)
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    (tmp_path / ".env").touch()
+    (tmp_path / ".airflowctl").mkdir()
+    venv_bin_airflow = tmp_path / ".venv" / "bin" / "airflow"
+    venv_bin_airflow.parent.mkdir(parents=True)
+    venv_bin_airflow.touch()
+
+    mode = VirtualenvMode(project_path=tmp_path, airflow_version="2.10.0", venv_path=str(tmp_path / ".venv"))
+    return mode, str(venv_bin_airflow)
+
+
+def test_start_foreground_execs_airflow(tmp_path, monkeypatch):
+    mode, venv_bin_airflow = _create_built_project(tmp_path, monkeypatch)
+
+    with mock.patch("airflowctl.modes.virtualenv.source_env_file"), mock.patch(
+        "airflowctl.modes.virtualenv.add_connections"
+    ), mock.patch("airflowctl.modes.virtualenv.add_variables"), mock.patch(
+        "subprocess.run"
+    ) as subprocess_run_mock, mock.patch(
+        "os.execve"
+    ) as execve_mock:
+        mode.start()
+
+    venv_env = mode._get_venv_env()
+    subprocess_run_mock.assert_has_calls(
+        [
+            mock.call([venv_bin_airflow, "db", "upgrade"], check=True, env=venv_env),
+            mock.call([venv_bin_airflow, "version"], check=True, env=venv_env),
+        ]
+    )
+    execve_mock.assert_called_once_with(venv_bin_airflow, ["airflow", "standalone"], venv_env)
+
+
+def test_start_background_records_pid(tmp_path, monkeypatch):
+    mode, venv_bin_airflow = _create_built_project(tmp_path, monkeypatch)
+    mode.background_logs_info_file = tmp_path / "background_logs_info.txt"
+
+    with mock.patch("airflowctl.modes.virtualenv.source_env_file"), mock.patch(
+        "airflowctl.modes.virtualenv.add_connections"
+    ), mock.patch("airflowctl.modes.virtualenv.add_variables"), mock.patch("subprocess.run"), mock.patch(
+        "subprocess.Popen"
+    ) as popen_mock, mock.patch(
+        "os.execve"
+    ) as execve_mock:
+        popen_mock.return_value.pid = 12345
+        mode.start(background=True)
+
+    execve_mock.assert_not_called()
+    assert popen_mock.call_args.args[0] == [venv_bin_airflow, "standalone"]
+    assert popen_mock.call_args.kwargs["env"] == mode._get_venv_env()
+    assert popen_mock.call_args.kwargs["start_new_session"] is True
+    assert mode.background_process_ids_file.read_text() == "12345"
+
+
+def test_start_airflow_not_installed(tmp_path, monkeypatch):
+    mode, venv_bin_airflow = _create_built_project(tmp_path, monkeypatch)
+    os.remove(venv_bin_airflow)
+
+    with mock.patch("airflowctl.modes.virtualenv.source_env_file"), mock.patch("subprocess.run") as run_mock:
+        with pytest.raises(typer.Exit):
+            mode.start()
+
+    run_mock.assert_not_called()
@@ -0,0 +1,308 @@
+import json
+import os
+import subprocess
+import sys
+import textwrap
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import httpx
+import pytest
+
+from airflowctl.utils import install_airflow
+from airflowctl.utils.install_airflow import get_airflow_versions, get_latest_airflow_version
+
+
+@pytest.fixture(autouse=True)
+def reset_pypi_cache_refresh_thread(monkeypatch):
+    monkeypatch.setattr(install_airflow, "_pypi_cache_refresh_thread", None)
+
+
+def test_get_latest_airflow_version_fresh_cache(tmp_path):
+    cache_file = tmp_path / "pypi_cache.json"
+    cache_file.write_text(json.dumps({"version": "2.10.0", "releases": ["2.10.0"]}))
+
+    with mock.patch.object(install_airflow, "PYPI_CACHE_FILE", cache_file), mock.patch(
+        "airflowctl.utils.install_airflow._fetch_airflow_pypi_metadata"
+    ) as fetch_mock, mock.patch("threading.Thread") as thread_mock:
+        assert get_latest_airflow_version() == "2.10.0"
+
+    fetch_mock.assert_not_called()
+    thread_mock.assert_not_called()
+
+
+def test_get_latest_airflow_version_stale_cache(tmp_path):
+    cache_file = tmp_path / "pypi_cache.json"
+    cache_file.write_text(json.dumps({"version": "2.9.0", "releases": ["2.9.0"]}))
+    stale_time = time.time() - install_airflow.PYPI_CACHE_TTL_SECONDS - 1
+    os.utime(cache_file, (stale_time, stale_time))
+
+    with mock.patch.object(install_airflow, "PYPI_CACHE_FILE", cache_file), mock.patch(
+        "threading.Thread"
+    ) as thread_mock, mock.patch("atexit.register"):
+        assert get_latest_airflow_version() == "2.9.0"
+
+    thread_mock.return_value.start.assert_called_once()
+
+
+def test_stale_cache_is_refreshed_before_exit(tmp_path):
+    cache_file = tmp_path / "pypi_cache.json"
+    cache_file.write_text(json.dumps({"version": "2.9.0", "releases": ["2.9.0"]}))
+    stale_time = time.time() - install_airflow.PYPI_CACHE_TTL_SECONDS - 1
+    os.utime(cache_file, (stale_time, stale_time))
+    response = mock.Mock()
+    response.json.return_value = {"info": {"version": "2.10.0"}, "releases": {"2.9.0": [], "2.10.0": []}}
+
+    with mock.patch.object(install_airflow, "PYPI_CACHE_FILE", cache_file), mock.patch(
+        "httpx.Client.get", return_value=response
+    ), mock.patch("atexit.register") as register_mock:
+        assert get_latest_airflow_version() == "2.9.0"
+        # Run the exit handler the refresh registered
+        register_mock.assert_called_once_with(install_airflow._wait_for_pypi_cache_refresh)
+        install_airflow._wait_for_pypi_cache_refresh()
+
+    assert not install_airflow._pypi_cache_refresh_thread.is_alive()
+    assert json.loads(cache_file.read_text()) == {"version": "2.10.0", "releases": ["2.9.0", "2.10.0"]}
+    assert list(tmp_path.iterdir()) == [cache_file]
+
+
+def test_get_latest_airflow_version_no_cache(tmp_path):
+    cache_file = tmp_path / "pypi_cache.json"
+    response = mock.Mock()
+    response.json.return_value = {"info": {"version": "2.10.1"}, "releases": {"2.10.0": [], "2.10.1": []}}
+
+    with mock.patch.object(install_airflow, "PYPI_CACHE_FILE", cache_file), mock.patch(
+        "httpx.Client.get", return_value=response
+    ):
+        assert get_latest_airflow_version() == "2.10.1"
+
+    assert json.loads(cache_file.read_text()) == {"version": "2.10.1", "releases": ["2.10.0", "2.10.1"]}
+
+
+def test_get_airflow_versions_from_cache(tmp_path):
+    cache_file = tmp_path / "pypi_cache.json"
+    cache_file.write_text(json.dumps({"version": "2.10.0", "releases": ["2.9.0", "2.10.0"]}))
+
+    with mock.patch.object(install_airflow, "PYPI_CACHE_FILE", cache_file), mock.patch(
+        "httpx.Client.get"
+    ) as get_mock:
+        assert get_airflow_versions(required_version="2.9.0") == ["2.9.0", "2.10.0"]
+
+    get_mock.assert_not_called()
+
+
+def test_get_airflow_versions_unknown_version_fetches(tmp_path):
+    cache_file = tmp_path / "pypi_cache.json"
+    cache_file.write_text(json.dumps({"version": "2.10.0", "releases": ["2.10.0"]}))
+    response = mock.Mock()
+    response.json.return_value = {"info": {"version": "2.10.1"}, "releases": {"2.10.0": [], "2.10.1": []}}
+
+    with mock.patch.object(install_airflow, "PYPI_CACHE_FILE", cache_file), mock.patch(
+        "httpx.Client.get", return_value=response
+    ) as get_mock:
+        assert get_airflow_versions(required_version="2.10.1") == ["2.10.0", "2.10.1"]
+
+    get_mock.assert_called_once()
+    assert json.loads(cache_file.read_text())["releases"] == ["2.10.0", "2.10.1"]
+    assert list(tmp_path.iterdir()) == [cache_file]
+
+
+def test_get_latest_airflow_version_network_error(tmp_path):
+    cache_file = tmp_path / "pypi_cache.json"
+
+    with mock.patch.object(install_airflow, "PYPI_CACHE_FILE", cache_file), mock.patch(
+        "httpx.Client.get", side_effect=httpx.ConnectError("offline")
+    ):
+        assert get_latest_airflow_version() == "2.7.0"
+
+
+def test_install_airflow_single_pip_invocation(tmp_path):
+    venv_path = str(tmp_path / ".venv")
+    venv_bin_python = os.path.join(venv_path, "bin", "python")
+    os.makedirs(os.path.dirname(venv_bin_python))
+    open(venv_bin_python, "w").close()
+
+    with mock.patch("airflowctl.utils.install_airflow.is_airflow_installed", return_value=False), mock.patch(
+        "subprocess.run"
+    ) as subprocess_run_mock:
+        install_airflow.install_airflow(
+            version="2.10.0",
+            venv_path=venv_path,
+            python_version="3.11.7",
+            project_path=tmp_path,
+        )
+
+    subprocess_run_mock.assert_called_once_with(
+        [
+            venv_bin_python,
+            "-m",
+            "pip",
+            "install",
+            "-r",
+            os.path.join(tmp_path, "requirements.txt"),
+            "apache-airflow==2.10.0",
+            "--constraint",
+            "https://raw.githubusercontent.com/apache/airflow/constraints-2.10.0/constraints-3.11.txt",
+        ],
+        check=True,
+        cwd=None,
+    )
+
+
+def test_install_airflow_prefers_downloaded_constraints_file(tmp_path):
+    venv_path = str(tmp_path / ".venv")
+    venv_bin_python = os.path.join(venv_path, "bin", "python")
+    os.makedirs(os.path.dirname(venv_bin_python))
+    open(venv_bin_python, "w").close()
+    constraints_file = tmp_path / "constraints-2.10.0-3.11.txt"
+    constraints_file.touch()
+
+    with mock.patch("airflowctl.utils.install_airflow.is_airflow_installed", return_value=False), mock.patch(
+        "subprocess.run"
+    ) as subprocess_run_mock:
+        install_airflow.install_airflow(
+            version="2.10.0",
+            venv_path=venv_path,
+            python_version="3.11.7",
+            project_path=tmp_path,
+            constraints_file=constraints_file,
+        )
+
+    install_command = subprocess_run_mock.call_args.args[0]
+    assert install_command[-2:] == ["--constraint", str(constraints_file)]
+    assert not any(arg.startswith("https://") for arg in install_command)
+
+
+def test_get_install_command_uv_available():
+    with mock.patch("shutil.which", return_value="/usr/bin/uv"):
+        cmd = install_airflow._get_install_command("/venv/bin/python", "uv pip")
+
+    assert cmd == ["/usr/bin/uv", "pip", "install", "--python", "/venv/bin/python"]
+
+
+def test_get_install_command_uv_not_available():
+    with mock.patch("shutil.which", return_value=None):
+        cmd = install_airflow._get_install_command("/venv/bin/python", "uv pip")
+
+    assert cmd == ["/venv/bin/python", "-m", "pip", "install"]
+
+
+def test_get_constraints_url(monkeypatch):
+    monkeypatch.delenv("AIRFLOWCTL_CONSTRAINTS", raising=False)
+    monkeypatch.delenv("AIRFLOWCTL_SKIP_CONSTRAINTS", raising=False)
+
+    assert install_airflow.get_constraints_url("2.10.0", "3.11.7") == (
+        "https://raw.githubusercontent.com/apache/airflow/constraints-2.10.0/constraints-3.11.txt"
+    )
+
+    monkeypatch.setenv("AIRFLOWCTL_SKIP_CONSTRAINTS", "true")
+    assert install_airflow.get_constraints_url("2.10.0", "3.11.7") is None
+
+
+def test_download_constraints_network_error(monkeypatch, tmp_path):
+    monkeypatch.delenv("AIRFLOWCTL_CONSTRAINTS", raising=False)
+    monkeypatch.delenv("AIRFLOWCTL_SKIP_CONSTRAINTS", raising=False)
+
+    with mock.patch.object(install_airflow, "CONSTRAINTS_CACHE_DIR", tmp_path), mock.patch(
+        "httpx.Client.get", side_effect=httpx.ConnectError("offline")
+    ):
+        assert install_airflow.download_constraints("2.10.0", "3.11.7") is None
+
+
+def test_download_constraints_cached(monkeypatch, tmp_path):
+    monkeypatch.delenv("AIRFLOWCTL_CONSTRAINTS", raising=False)
+    monkeypatch.delenv("AIRFLOWCTL_SKIP_CONSTRAINTS", raising=False)
+    response = mock.Mock(content=b"apache-airflow-providers-http==4.0.0\n")
+
+    with mock.patch.object(install_airflow, "CONSTRAINTS_CACHE_DIR", tmp_path), mock.patch(
+        "httpx.Client.get", return_value=response
+    ) as get_mock:
+        constraints_file = install_airflow.download_constraints("2.10.0", "3.11.7")
+        assert install_airflow.download_constraints("2.10.0", "3.11.7") == constraints_file
+
+    assert constraints_file == tmp_path / "constraints-2.10.0-3.11.txt"
+    assert constraints_file.read_bytes() == b"apache-airflow-providers-http==4.0.0\n"
+    get_mock.assert_called_once()
+
+
+def test_download_constraints_custom_url(monkeypatch):
+    monkeypatch.setenv("AIRFLOWCTL_CONSTRAINTS", "https://example.com/constraints.txt")
+    monkeypatch.delenv("AIRFLOWCTL_SKIP_CONSTRAINTS", raising=False)
+
+    with mock.patch("httpx.Client.get") as get_mock:
+        assert install_airflow.download_constraints("2.10.0", "3.11.7") is None
+
+    get_mock.assert_not_called()
+
+
+def test_is_airflow_installed_reads_metadata(tmp_path):
+    venv_path = tmp_path / ".venv"
+    (venv_path / "bin").mkdir(parents=True)
+    (venv_path / "bin" / "airflow").touch()
+    dist_info = venv_path / "lib" / "python3.11" / "site-packages" / "apache_airflow-2.10.0.dist-info"
+    dist_info.mkdir(parents=True)
+    (dist_info / "METADATA").write_text(
+        "Metadata-Version: 2.3\nName: apache-airflow\nVersion: 2.10.0\n\nBody"
+    )
+
+    with mock.patch("subprocess.run") as subprocess_run_mock:
+        assert install_airflow.is_airflow_installed(str(venv_path), "2.10.0", project_path=tmp_path)
+
+        (tmp_path / "airflow.db").touch()
+        assert not install_airflow.is_airflow_installed(str(venv_path), "2.9.0", project_path=tmp_path)
+
+    subprocess_run_mock.assert_not_called()
+    assert not (tmp_path / "airflow.db").exists()
+
+
+def test_get_latest_airflow_version_server_error(tmp_path):
+    cache_file = tmp_path / "pypi_cache.json"
+    response = httpx.Response(503, text="<html>Service Unavailable</html>")
+    response.request = httpx.Request("GET", install_airflow.AIRFLOW_PYPI_URL)
+
+    with mock.patch.object(install_airflow, "PYPI_CACHE_FILE", cache_file), mock.patch(
+        "httpx.Client.get", return_value=response
+    ):
+        assert get_latest_airflow_version() == "2.7.0"
+
+    assert not cache_file.exists()
+
+
+def test_get_http_client_is_shared_across_threads(monkeypatch):
+    monkeypatch.setattr(install_airflow, "_http_client", None)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        clients = list(executor.map(lambda _: install_airflow.get_http_client(), range(8)))
+
+    assert all(client is clients[0] for client in clients)
+    clients[0].close()
+
+
+def test_cache_hits_do_not_import_httpx(tmp_path):
+    config_dir = tmp_path / ".airflowctl"
+    (config_dir / "constraints").mkdir(parents=True)
+    (config_dir / "constraints" / "constraints-2.10.0-3.11.txt").touch()
+    (config_dir / "pip.pyz").touch()
+    (config_dir / f"pip-{sys.version_info[0]}.{sys.version_info[1]}.pyz").touch()
+    (config_dir / "pypi_cache.json").write_text(json.dumps({"version": "2.10.0", "releases": ["2.10.0"]}))
+    env = {k: v for k, v in os.environ.items() if not k.startswith("AIRFLOWCTL_")}
+    env["HOME"] = str(tmp_path)
+
+    script = textwrap.dedent(
+        """
+        import subprocess
+        import sys
+        from unittest import mock
+
+        from airflowctl.modes.virtualenv import bootstrap_pip
+        from airflowctl.utils.install_airflow import download_constraints, get_latest_airflow_version
+
+        assert get_latest_airflow_version() == "2.10.0"
+        assert download_constraints("2.10.0", "3.11.7") is not None
+        with mock.patch("subprocess.run"):
+            bootstrap_pip(sys.executable, sys.version_info[:2])
+        assert "httpx" not in sys.modules
+        """
+    )
+    subprocess.run([sys.executable, "-c", script], check=True, env=env)
@@ -0,0 +1,24 @@
+import os
+
+from airflowctl.utils.project import load_settings
+
+
+def test_load_settings_is_cached_until_file_changes(tmp_path):
+    settings_file = tmp_path / "settings.yaml"
+    settings_file.write_text('airflow_version: "2.10.0"\npython_version: "3.11"\n')
+
+    settings = load_settings(settings_file)
+    assert settings == {"airflow_version": "2.10.0", "python_version": "3.11"}
+    assert load_settings(settings_file) is settings
+
+    settings_file.write_text('airflow_version: "2.10.1"\npython_version: "3.11"\n')
+    stat = settings_file.stat()
+    os.utime(settings_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert load_settings(settings_file)["airflow_version"] == "2.10.1"
+
+
+def test_load_settings_empty_file(tmp_path):
+    settings_file = tmp_path / "settings.yaml"
+    settings_file.touch()
+
+    assert load_settings(settings_file) == {}